@@ -5,23 +5,16 @@ SPDX-License-Identifier: Apache-2.0
 Top-level package for access-ipy-telemetry.
 """
 
-import warnings
 from IPython.core.getipython import get_ipython
 from IPython.core.interactiveshell import InteractiveShell
 
 from . import _version
 from .ast import capture_registered_calls
 from .api import SessionID  # noqa
-from .registry import RegisterWarning
-from .utils import ENDPOINTS, REGISTRIES
+from .registry import RegisterWarning  # noqa
 
-
-# Make sure that our registries & endpoints match up
-if not set(REGISTRIES.keys()) == set(ENDPOINTS.keys()):
-    warnings.warn(
-        "Mismatch between registries and endpoints - some telemetry calls may not be recorded.",
-        category=RegisterWarning,
-    )
+# NB: the registries/endpoints mismatch check lives in ApiHandler.__init__ so
+# that importing the package doesn't force config.yaml to be parsed.
 
 
 def load_ipython_extension(ipython: InteractiveShell) -> None:
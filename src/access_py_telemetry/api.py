@@ -3,38 +3,161 @@ Copyright 2022 ACCESS-NRI and contributors. See the top-level COPYRIGHT file for
 SPDX-License-Identifier: Apache-2.0
 """
 
-from typing import Any, Type, TypeVar, Iterable
+from typing import Any, Callable, Type, TypeVar, Iterable
+import atexit
+import logging
+import os
+import sys
 import warnings
 import getpass
-import datetime
 import hashlib
+import time
 import httpx
 import asyncio
-import pydantic
-import yaml
-import multiprocessing
-from pathlib import Path
-from multiprocessing import Process
+import concurrent.futures
+import threading
+import weakref
+
+from .utils import get_endpoints, get_registries
 
 try:
-    multiprocessing.set_start_method("spawn")
-except RuntimeError:
-    """
-    Since this is a side effect on module import, we can't guarantee that it will
-    always be called before the first Process is created, or that the start method
-    isn't already set. In this case, we just ignore the error - the processes should
-    still work fine.
-    """
-from .utils import ENDPOINTS, REGISTRIES
+    # orjson serializes several times faster than the stdlib encoder, emits
+    # bytes directly, and handles numpy scalars/arrays natively.
+    import orjson
+
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+
+except ImportError:
+    import json
+
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data).encode()
+
+
+logger = logging.getLogger(__name__)
 
 S = TypeVar("S", bound="SessionID")
 H = TypeVar("H", bound="ApiHandler")
 
-with open(Path(__file__).parent / "config.yaml", "r") as f:
-    config = yaml.safe_load(f)
+# Signature of the specialized per-service record constructors: they take
+# (function_name, args, kwargs) and return the finished telemetry record.
+_RecordBuilder = Callable[
+    [str, list[Any] | tuple[Any, ...], dict[str, Any]], dict[str, Any]
+]
 
 SERVER_URL = "https://tracking-services-d6c2fd311c12.herokuapp.com"
 
+_HEADERS = {"Content-Type": "application/json"}
+
+# Setting ACCESS_PY_TELEMETRY_DISABLE (to anything) before import turns all
+# telemetry into a no-op, skipping record construction entirely.
+_TELEMETRY_ENABLED = os.environ.get("ACCESS_PY_TELEMETRY_DISABLE") is None
+
+_USER: str | None = None
+_SESSION_ID: str | None = None
+
+_MAX_REPR_LENGTH = 256
+_MAX_SUMMARY_ITEMS = 10
+
+
+def _summarize(value: Any, depth: int = 2) -> Any:
+    """
+    Coerce an arg/kwarg value into a cheap, bounded-size, JSON-native summary.
+
+    Small native scalars and containers pass through unchanged; long strings,
+    large containers and arbitrary objects (numpy arrays, dataframes, ...)
+    collapse to a truncated repr. This keeps record size O(1), stops
+    _last_record pinning large caller objects between sends, and makes the
+    serialization step constant-time.
+    """
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        return value if len(value) <= _MAX_REPR_LENGTH else value[:_MAX_REPR_LENGTH]
+    if depth > 0 and isinstance(value, (list, tuple, set, frozenset)):
+        if len(value) <= _MAX_SUMMARY_ITEMS:
+            return [_summarize(item, depth - 1) for item in value]
+    elif depth > 0 and isinstance(value, dict):
+        if len(value) <= _MAX_SUMMARY_ITEMS:
+            return {str(key): _summarize(val, depth - 1) for key, val in value.items()}
+    return repr(value)[:_MAX_REPR_LENGTH]
+
+
+_persistent_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread: threading.Thread | None = None
+_loop_lock = threading.Lock()
+
+# Sends submitted to the background loop that haven't completed yet. The exit
+# flush blocks on these: the loop runs on a daemon thread, so without the wait
+# the interpreter would kill it mid-request and drop the telemetry.
+_pending_futures: "set[concurrent.futures.Future[None]]" = set()
+
+# How long the exit flush waits for in-flight sends. The shared client times
+# requests out after 5s, so sends resolve well within this.
+_EXIT_FLUSH_TIMEOUT = 10.0
+
+# The private C-accelerated helper returns None instead of raising when no
+# loop is running, which keeps the common no-loop case off the (expensive)
+# exception path. Fall back to the public API if it ever disappears.
+_get_running_loop: Callable[[], asyncio.AbstractEventLoop | None] | None = getattr(
+    asyncio, "_get_running_loop", None
+)
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    """
+    Return the currently-running event loop, or None, without raising.
+    """
+    if _get_running_loop is not None:
+        return _get_running_loop()
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _get_persistent_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the background event loop used when the caller has no loop running,
+    starting its daemon thread on first use. Reusing a single loop avoids
+    paying event-loop (previously: whole process) startup per telemetry call.
+    """
+    global _persistent_loop, _loop_thread
+    with _loop_lock:
+        if _loop_thread is None or not _loop_thread.is_alive():
+            _persistent_loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(
+                target=_persistent_loop.run_forever,
+                name="access-py-telemetry-loop",
+                daemon=True,
+            )
+            _loop_thread.start()
+    assert _persistent_loop is not None
+    return _persistent_loop
+
+
+def _get_user() -> str:
+    """
+    Return the login name of the current user, computed once and cached -
+    getpass.getuser() can shell out on some systems, so we don't want it on
+    the per-record path.
+    """
+    global _USER
+    if _USER is None:
+        _USER = getpass.getuser()
+    return _USER
+
+
+def _get_session_id() -> str:
+    """
+    Return the session ID for this process, generating it on first access.
+    """
+    global _SESSION_ID
+    if _SESSION_ID is None:
+        _SESSION_ID = SessionID.create_session_id()
+    return _SESSION_ID
+
 
 class ApiHandler:
     """
@@ -47,10 +170,32 @@ class ApiHandler:
 
     _instance = None
     _server_url = SERVER_URL[:]
-    endpoints = {service: endpoint for service, endpoint in ENDPOINTS.items()}
-    registries = {service for service in REGISTRIES}
-    _extra_fields: dict[str, dict[str, Any]] = {ep_name: {} for ep_name in ENDPOINTS}
-    _pop_fields: dict[str, list[str]] = {}
+    _client: httpx.AsyncClient | None = None
+
+    # Batching knobs: records are buffered per endpoint and POSTed as a JSON
+    # array once batch_size records accumulate, or after flush_interval_s
+    # seconds when an event loop is running. Leftovers go out at exit.
+    batch_size: int = 10
+    flush_interval_s: float = 1.0
+
+    # Ceiling on simultaneous in-flight POSTs per event loop.
+    max_concurrent_requests: int = 8
+
+    # Set to True to put args/kwargs into records verbatim (for debugging)
+    # instead of the bounded _summarize() form.
+    raw_args: bool = False
+
+    # The fields every record carries unless a service's pop_fields strips them.
+    _default_keys = frozenset({"name", "function", "args", "kwargs", "session_id"})
+
+    _endpoints: dict[str, str]
+    _full_endpoints: dict[str, str]
+    registries: set[str]
+    _extra_fields: dict[str, dict[str, Any]]
+    _pop_fields: dict[str, frozenset[str]]
+    _buffers: dict[str, list[dict[str, Any]]]
+    _flush_task: "asyncio.Task[None] | None"
+    _builders: dict[str, "_RecordBuilder"]
 
     def __new__(cls: Type[H]) -> H:
         if cls._instance is None:
@@ -63,20 +208,70 @@ class ApiHandler:
         if hasattr(self, "_initialized"):
             return None
         self._initialized = True
+        self._buffers = {}
+        self._flush_task = None
+        self._builders = {}
+        # Config is parsed lazily, on the first ApiHandler instantiation rather
+        # than at import time.
+        self.endpoints = get_endpoints().copy()
+        self.registries = set(get_registries())
+        # Make sure that our registries & endpoints match up
+        if self.registries != set(self.endpoints):
+            from .registry import RegisterWarning
+
+            warnings.warn(
+                "Mismatch between registries and endpoints - some telemetry calls may not be recorded.",
+                category=RegisterWarning,
+            )
+        self._extra_fields = {ep_name: {} for ep_name in self.endpoints}
+        self._pop_fields = {}
+
+    @classmethod
+    def _reset(cls) -> None:
+        """
+        Drop the singleton and restore class-level defaults. Endpoint, registry
+        and field state lives on the instance and is rebuilt from config on the
+        next instantiation, so this is all a reset needs. Primarily a test hook.
+        """
+        cls._instance = None
+        cls._server_url = SERVER_URL[:]
+        return None
+
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """
+        Return the shared AsyncClient, creating it on first use. Reusing a single
+        client means repeated telemetry calls reuse pooled keep-alive connections
+        instead of paying a fresh TCP + TLS handshake per call.
+        """
+        if cls._client is None or cls._client.is_closed:
+            cls._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                timeout=httpx.Timeout(5.0),
+            )
+        return cls._client
 
     @property
     def extra_fields(self) -> dict[str, Any]:
         return self._extra_fields
 
-    @pydantic.validate_call
     def add_extra_fields(self, service_name: str, fields: dict[str, Any]) -> None:
         """
         Add an extra field to the telemetry data. Only works for services that
         already have an endpoint defined.
         """
+        if not isinstance(service_name, str):
+            raise TypeError(
+                f"service_name must be a str, not {type(service_name).__name__}"
+            )
+        if not isinstance(fields, dict) or not all(
+            isinstance(key, str) for key in fields
+        ):
+            raise TypeError("fields must be a dict with str keys")
         if service_name not in self.endpoints:
             raise KeyError(f"Endpoint for '{service_name}' not found")
         self._extra_fields[service_name] = fields
+        self._builders.pop(service_name, None)
         return None
 
     @property
@@ -89,13 +284,35 @@ class ApiHandler:
         Set the server URL for the telemetry API.
         """
         self._server_url = url
+        self._rebuild_urls()
+        return None
+
+    @property
+    def endpoints(self) -> dict[str, str]:
+        return self._endpoints
+
+    @endpoints.setter
+    def endpoints(self, endpoints: dict[str, str]) -> None:
+        self._endpoints = endpoints
+        self._rebuild_urls()
+        self._builders.clear()
+
+    def _rebuild_urls(self) -> None:
+        """
+        Precompute the full endpoint URLs, so the per-call path avoids a dict
+        lookup plus two f-string formats. Rebuilt whenever server_url or
+        endpoints change.
+        """
+        self._full_endpoints = {
+            service: f"{self._server_url}{endpoint}"
+            for service, endpoint in self._endpoints.items()
+        }
         return None
 
     @property
-    def pop_fields(self) -> dict[str, list[str]]:
+    def pop_fields(self) -> dict[str, frozenset[str]]:
         return self._pop_fields
 
-    @pydantic.validate_call
     def remove_fields(self, service: str, fields: str | Iterable[str]) -> None:
         """
         Set the fields to remove from the telemetry data for a given service. Useful for excluding default
@@ -105,9 +322,15 @@ class ApiHandler:
         Note: This does not use a set union, so you must specify all fields you want to remove in one call.
         # TODO: Maybe make this easier to use?
         """
+        if not isinstance(service, str):
+            raise TypeError(f"service must be a str, not {type(service).__name__}")
         if isinstance(fields, str):
-            fields = [fields]
-        self._pop_fields[service] = list(fields)
+            fields = (fields,)
+        popped = frozenset(fields)
+        if not all(isinstance(field, str) for field in popped):
+            raise TypeError("fields must be a str or an iterable of str")
+        self._pop_fields[service] = popped
+        self._builders.pop(service, None)
 
     def send_api_request(
         self,
@@ -138,23 +361,65 @@ class ApiHandler:
             If the request fails.
 
         """
+        if not _TELEMETRY_ENABLED:
+            return None
 
-        telemetry_data = self._create_telemetry_record(
-            service_name, function_name, args, kwargs
-        )
-
+        # Resolve the endpoint first so an unknown service fails before we pay
+        # for building the record.
         try:
-            endpoint = self.endpoints[service_name]
+            endpoint = self._full_endpoints[service_name]
         except KeyError as e:
             raise KeyError(
                 f"Endpoint for '{service_name}' not found in {self.endpoints}"
             ) from e
 
-        endpoint = f"{self.server_url}{endpoint}"
+        telemetry_data = self._create_telemetry_record(
+            service_name, function_name, args, kwargs
+        )
+
+        self._enqueue(endpoint, telemetry_data)
+        return None
+
+    def _enqueue(self, endpoint: str, record: dict[str, Any]) -> None:
+        """
+        Buffer a telemetry record for the given endpoint.
+
+        Coalescing records into batches collapses one HTTPS round-trip per
+        tracked call into one per batch - a big win when a tracked function is
+        hammered in a loop.
+        """
+        buffer = self._buffers.setdefault(endpoint, [])
+        buffer.append(record)
+        if len(buffer) >= self.batch_size:
+            self._flush_endpoint(endpoint)
+            return None
+        loop = _running_loop()
+        if loop is None:
+            # No loop to hang a timer off: the batch-size check above and the
+            # atexit hook cover flushing in this case.
+            return None
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_later())
+        return None
 
-        send_in_loop(endpoint, telemetry_data)
+    def _flush_endpoint(self, endpoint: str) -> None:
+        batch = self._buffers.pop(endpoint, None)
+        if batch:
+            send_in_loop(endpoint, batch)
         return None
 
+    def flush(self) -> None:
+        """
+        Flush all buffered telemetry records immediately.
+        """
+        for endpoint in list(self._buffers):
+            self._flush_endpoint(endpoint)
+        return None
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval_s)
+        self.flush()
+
     def _create_telemetry_record(
         self,
         service_name: str,
@@ -167,39 +432,114 @@ class ApiHandler:
 
         Notes
         -----
-        SessionID() is a lazily evaluated singleton, so it looks like we are
-        going to generate a new session ID every time we call this function, but we
-        aren't. I've also modified __get__, so SessionID() evaluates to a string.
+        The session ID is generated once per process and memoized, so every
+        record in a session shares the same ID.
         """
-        telemetry_data = {
-            "name": getpass.getuser(),
-            "function": function_name,
-            "args": args,
-            "kwargs": kwargs,
-            "session_id": SessionID(),
-            **self.extra_fields.get(service_name, {}),
-        }
+        builder = self._builders.get(service_name)
+        if builder is None:
+            builder = self._builders[service_name] = self._make_record_builder(
+                service_name
+            )
 
-        for field in self.pop_fields.get(service_name, []):
-            telemetry_data.pop(field)
+        telemetry_data = builder(function_name, args, kwargs)
 
         self._last_record = telemetry_data
         return telemetry_data
 
+    def _make_record_builder(self, service_name: str) -> _RecordBuilder:
+        """
+        Build a specialized record constructor for a service.
+
+        The shape of a service's records only changes when add_extra_fields /
+        remove_fields / endpoints are updated (all of which invalidate the
+        cached builder), so we decide which keys to produce once per
+        configuration change, rather than building the full record and popping
+        fields back out of it on every call.
+        """
+        popped = self._pop_fields.get(service_name, frozenset())
+        allowed = self._default_keys - popped
+        # Captured by reference, not snapshotted: mutating the dict handed out
+        # by the extra_fields property in place must keep taking effect on the
+        # next record, as it did before builders were introduced.
+        extra = self._extra_fields.setdefault(service_name, {})
+
+        if not popped:
+            # Common case: nothing is stripped, so the record can be built as
+            # a single pre-sized dict literal plus one update for the extras.
+            def build_full_record(
+                function_name: str,
+                args: list[Any] | tuple[Any, ...],
+                kwargs: dict[str, Any],
+            ) -> dict[str, Any]:
+                raw = self.raw_args
+                record = {
+                    "name": _get_user(),
+                    "function": function_name,
+                    "args": args if raw else [_summarize(arg) for arg in args],
+                    "kwargs": (
+                        kwargs
+                        if raw
+                        else {key: _summarize(val) for key, val in kwargs.items()}
+                    ),
+                    "session_id": _get_session_id(),
+                }
+                if extra:
+                    record.update(extra)
+                return record
+
+            return build_full_record
+
+        with_name = "name" in allowed
+        with_function = "function" in allowed
+        with_args = "args" in allowed
+        with_kwargs = "kwargs" in allowed
+        with_session_id = "session_id" in allowed
+
+        def build_record(
+            function_name: str,
+            args: list[Any] | tuple[Any, ...],
+            kwargs: dict[str, Any],
+        ) -> dict[str, Any]:
+            record: dict[str, Any] = {}
+            if with_name:
+                record["name"] = _get_user()
+            if with_function:
+                record["function"] = function_name
+            if with_args:
+                record["args"] = (
+                    args if self.raw_args else [_summarize(arg) for arg in args]
+                )
+            if with_kwargs:
+                record["kwargs"] = (
+                    kwargs
+                    if self.raw_args
+                    else {key: _summarize(val) for key, val in kwargs.items()}
+                )
+            if with_session_id:
+                record["session_id"] = _get_session_id()
+            if extra:
+                for key, value in extra.items():
+                    if key not in popped:
+                        record[key] = value
+            return record
+
+        return build_record
+
 
 class SessionID:
     """
     Singleton class to store and generate a unique session ID.
 
-    This class ensures that only one instance of the session ID exists. The session
-    ID is generated the first time it is accessed and is represented as a string.
     The session ID is created using the current user's login name and the current
-    timestamp, hashed with SHA-256.
+    timestamp, hashed with SHA-256. The heavy lifting now lives in the module
+    level `_get_session_id()`, which is memoized - this class is kept as a thin
+    backwards-compatible shim, and `SessionID()` still evaluates to the same
+    string on every access.
 
     Methods:
         __new__(cls, *args, **kwargs): Ensures only one instance of the class is created.
         __init__(self): Initializes the instance.
-        __get__(self, obj: object, objtype: type | None = None) -> str: Generates and returns the session ID.
+        __get__(self, obj: object, objtype: type | None = None) -> str: Returns the session ID.
         create_session_id() -> str: Static method to create a unique session ID.
     """
 
@@ -216,20 +556,20 @@ class SessionID:
         self.initialized = True
 
     def __get__(self, obj: object, objtype: type | None = None) -> str:
-        if not hasattr(self, "value"):
-            self.value = SessionID.create_session_id()
-        return self.value
+        return _get_session_id()
 
     @staticmethod
     def create_session_id() -> str:
-        login = getpass.getuser()
-        timestamp = datetime.datetime.now().isoformat()
-        session_str = f"{login}_{timestamp}"
+        # time_ns() is a single syscall - no datetime allocation/formatting
+        # just to feed a timestamp into the hash.
+        session_str = f"{_get_user()}_{time.time_ns()}"
         session_id = hashlib.sha256((session_str).encode()).hexdigest()
         return session_id
 
 
-async def send_telemetry(endpoint: str, data: dict[str, Any]) -> None:
+async def send_telemetry(
+    endpoint: str, data: dict[str, Any] | list[dict[str, Any]]
+) -> None:
     """
     Asynchronously send telemetry data to the specified endpoint.
 
@@ -248,26 +588,69 @@ async def send_telemetry(endpoint: str, data: dict[str, Any]) -> None:
     RuntimeWarning
         If the request fails.
     """
-    headers = {"Content-Type": "application/json"}
-    async with httpx.AsyncClient() as client:
-        try:
-            print(f"Posting telemetry to {endpoint}")
-            response = await client.post(endpoint, json=data, headers=headers)
-            response.raise_for_status()
-        except (httpx.RequestError, httpx.HTTPStatusError) as e:
-            warnings.warn(f"Request failed: {e}", category=RuntimeWarning, stacklevel=2)
+    client = ApiHandler._get_client()
+    try:
+        logger.debug("Posting telemetry to %s", endpoint)
+        payload = _dumps(data)
+        response = await client.post(endpoint, content=payload, headers=_HEADERS)
+        response.raise_for_status()
+    except (TypeError, ValueError) as e:
+        warnings.warn(
+            f"Failed to serialize telemetry data: {e}",
+            category=RuntimeWarning,
+            stacklevel=2,
+        )
+    except (httpx.RequestError, httpx.HTTPStatusError) as e:
+        warnings.warn(f"Request failed: {e}", category=RuntimeWarning, stacklevel=2)
+    return None
+
+
+# Weakly keyed so short-lived loops (one per asyncio.run() call) aren't kept
+# alive, with their semaphores, after they are dropped.
+_semaphores: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]"
+) = weakref.WeakKeyDictionary()
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """
+    Return the concurrency-limiting semaphore for the running loop, creating it
+    on first use. Semaphores are bound to the loop they were created under, so
+    they are cached per loop to avoid "attached to a different loop" errors.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(
+            ApiHandler.max_concurrent_requests
+        )
+    return semaphore
+
+
+async def _send_gated(
+    endpoint: str, data: dict[str, Any] | list[dict[str, Any]]
+) -> None:
+    """
+    Send telemetry while holding the shared semaphore, so a burst of tracked
+    calls keeps a sliding window of at most max_concurrent_requests POSTs in
+    flight instead of exhausting the connection pool.
+    """
+    async with _get_semaphore():
+        await send_telemetry(endpoint, data)
     return None
 
 
 def send_in_loop(
-    endpoint: str, telemetry_data: dict[str, Any], timeout: float | None = None
+    endpoint: str,
+    telemetry_data: dict[str, Any] | list[dict[str, Any]],
+    timeout: float | None = None,
 ) -> None:
     """
     Wraps the send_telemetry function in an event loop. This function will:
     - Check if an event loop is already running
     - If an event loop is running, send the telemetry data in the background
-    - If an event loop is not running, create a new event loop in a separate process
-        and send the telemetry data in the background using that loop.
+    - If an event loop is not running, submit the coroutine to a persistent
+        background loop running on a daemon thread, shared by all calls.
 
     Parameters
     ----------
@@ -276,81 +659,105 @@ def send_in_loop(
     telemetry_data : dict
         The telemetry data to send.
     timeout : float, optional
-        The maximum time to wait for the coroutine to finish. If the coroutine takes
-        longer than this time, a TimeoutError will be raised. If None, the coroutine
-        will terminate after 60 seconds.
+        Unused - retained for backwards compatibility. Sends no longer block
+        the caller; failures are surfaced as warnings from a done-callback.
 
     Returns
     -------
     None
 
     """
-    timeout = timeout or 60
-
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        _run_in_proc(endpoint, telemetry_data, timeout)
-    else:
-        loop.create_task(send_telemetry(endpoint, telemetry_data))
+    loop = _running_loop()
+    if loop is not None:
+        loop.create_task(_send_gated(endpoint, telemetry_data))
         return None
 
+    future = asyncio.run_coroutine_threadsafe(
+        _send_gated(endpoint, telemetry_data), _get_persistent_loop()
+    )
+    _pending_futures.add(future)
+    future.add_done_callback(_on_send_done)
+    return None
 
-def _run_event_loop(endpoint: str, telemetry_data: dict[str, Any]) -> None:
-    """
-    Handles the creation and running of an event loop for sending telemetry data.
-    This function is intended to be run in a separate process, and will:
-    - Create a new event loop
-    - Send the telemetry data
-    - Run the event loop until the telemetry data is sent
 
-    Parameters
-    ----------
-    endpoint : str
-        The URL to send the telemetry data to.
-    telemetry_data : dict
-        The telemetry data to send.
+def _on_send_done(future: "concurrent.futures.Future[None]") -> None:
+    _pending_futures.discard(future)
+    _warn_if_failed(future)
+    return None
 
-    Returns
-    -------
-    None
+
+def _warn_if_failed(future: "concurrent.futures.Future[None]") -> None:
+    """
+    Surface exceptions from fire-and-forget sends as warnings. Request-level
+    failures are already warned about inside send_telemetry; this catches
+    anything unexpected (eg. serialization errors) without blocking the caller.
     """
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    loop.run_until_complete(send_telemetry(endpoint, telemetry_data))
+    if future.cancelled():
+        return None
+    exc = future.exception()
+    if exc is not None:
+        warnings.warn(
+            f"Telemetry send failed: {exc}", category=RuntimeWarning, stacklevel=2
+        )
+    return None
 
 
-def _run_in_proc(endpoint: str, telemetry_data: dict[str, Any], timeout: float) -> None:
+def _maybe_install_uvloop() -> None:
     """
-    Handles the creation and running of a separate process for sending telemetry data.
-    This function will:
-    - Create a new process and run the _run_event_loop function in that process
-    - Wait for the process to finish
-    - If the process takes longer than the specified timeout, terminate the process
-        and raise a warning
+    Install uvloop as the default event-loop policy, if available.
+
+    libuv-backed loops have much lower per-task and socket-write overhead than
+    the default selector loop, which is exactly what the fire-and-forget POSTs
+    here spend their time on. Because installing a policy affects any loop the
+    consuming application creates after import, this is opt-in: set
+    ACCESS_PY_TELEMETRY_UVLOOP=1 to enable it. No-op on Windows or when uvloop
+    is not installed.
+    """
+    if sys.platform == "win32":
+        return None
+    if os.environ.get("ACCESS_PY_TELEMETRY_UVLOOP") != "1":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    uvloop.install()
+    return None
 
-    Parameters
-    ----------
-    endpoint : str
-        The URL to send the telemetry data to.
-    telemetry_data : dict
-        The telemetry data to send.
-    timeout : float
-        The maximum time to wait for the process to finish.
 
-    Returns
-    -------
-    None
+_maybe_install_uvloop()
+
 
+@atexit.register
+def _close_client() -> None:
     """
-    proc = Process(target=_run_event_loop, args=(endpoint, telemetry_data))
-    proc.start()
-    proc.join(timeout)
-    if proc.is_alive():
-        proc.terminate()
-        warnings.warn(
-            f"Telemetry data not sent within {timeout} seconds",
-            category=RuntimeWarning,
-            stacklevel=2,
-        )
+    Close the shared AsyncClient (if one was ever created) on interpreter exit,
+    so pooled connections are shut down cleanly.
+    """
+    client = ApiHandler._client
+    if client is not None and not client.is_closed:
+        try:
+            asyncio.run(client.aclose())
+        except RuntimeError:
+            # A loop is still running (eg. IPython) - the connections will be
+            # torn down with the process anyway.
+            pass
+    return None
+
+
+@atexit.register
+def _flush_buffers() -> None:
+    """
+    Send any telemetry records still sitting in the batch buffers at
+    interpreter exit, then block until all in-flight sends complete - without
+    the wait, the daemon thread carrying the background loop would be killed
+    mid-request and short-lived scripts would silently lose their telemetry.
+    Registered after _close_client so (atexit being LIFO) it runs before the
+    shared client is torn down.
+    """
+    handler = ApiHandler._instance
+    if handler is not None:
+        handler.flush()
+    if _pending_futures:
+        concurrent.futures.wait(tuple(_pending_futures), timeout=_EXIT_FLUSH_TIMEOUT)
     return None
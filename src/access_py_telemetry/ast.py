@@ -5,17 +5,23 @@ SPDX-License-Identifier: Apache-2.0
 
 from typing import Any
 import ast
+import functools
 from IPython.core.getipython import get_ipython
 from IPython.core.interactiveshell import ExecutionInfo
 
 from .api import ApiHandler
 from .registry import TelemetryRegister
-from .utils import REGISTRIES
+from .utils import get_registries
 
 
-api_handler = ApiHandler()
-
-registries = {registry: TelemetryRegister(registry) for registry in REGISTRIES.keys()}
+@functools.cache
+def _get_capture_registries() -> dict[str, TelemetryRegister]:
+    """
+    Build the {service: register} mapping on first cell execution, rather than
+    at import time - this is what defers config.yaml parsing until telemetry
+    is actually used.
+    """
+    return {registry: TelemetryRegister(registry) for registry in get_registries()}
 
 
 def capture_registered_calls(info: ExecutionInfo) -> None:
@@ -37,6 +43,9 @@ def capture_registered_calls(info: ExecutionInfo) -> None:
     if code is None:
         return None
 
+    api_handler = ApiHandler()
+    registries = _get_capture_registries()
+
     # Remove lines that contain IPython magic commands
     code = "\n".join(
         line for line in code.splitlines() if not line.strip().startswith("%")
@@ -2,7 +2,28 @@ from typing import Callable, Any, Iterable
 from .registry import TelemetryRegister
 from functools import wraps
 
-from .api import ApiHandler, send_in_loop
+from .api import ApiHandler, _TELEMETRY_ENABLED
+
+
+def _configure_service(
+    api_handler: ApiHandler,
+    service: str,
+    extra_fields: dict[str, Any] | None,
+    pop_fields: Iterable[str] | None,
+) -> None:
+    """
+    Apply extra/pop field configuration for a service, skipping the mutators
+    (and their record-builder invalidation) when the handler already holds the
+    target state - decorating many functions for one service usually repeats
+    identical arguments.
+    """
+    extra = extra_fields or {}
+    if api_handler._extra_fields.get(service) != extra:
+        api_handler.add_extra_fields(service, extra)
+    popped = frozenset(pop_fields or ())
+    if api_handler._pop_fields.get(service) != popped:
+        api_handler.remove_fields(service, popped)
+    return None
 
 
 def ipy_register_func(
@@ -34,12 +55,17 @@ def ipy_register_func(
         The function with the telemetry decorator.
     """
 
+    register = TelemetryRegister(service)
+
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if not _TELEMETRY_ENABLED:
+            # Telemetry disabled: leave the function untouched.
+            return func
+
         api_handler = ApiHandler()
 
-        api_handler.add_extra_fields(service, extra_fields or {})
-        api_handler.remove_fields(service, pop_fields or [])
-        TelemetryRegister(service).register(func.__name__)
+        _configure_service(api_handler, service, extra_fields, pop_fields)
+        register.register(func.__name__)
 
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -78,25 +104,24 @@ def register_func(
         The function with the telemetry decorator.
     """
 
+    register = TelemetryRegister(service)
+
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if not _TELEMETRY_ENABLED:
+            # Telemetry disabled: leave the function untouched.
+            return func
+
         api_handler = ApiHandler()
 
         # Configure fields & register the function
-        api_handler.add_extra_fields(service, extra_fields or {})
-        api_handler.remove_fields(service, pop_fields or [])
-        TelemetryRegister(service).register(func.__name__)
+        _configure_service(api_handler, service, extra_fields, pop_fields)
+        register.register(func.__name__)
 
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            telemetry_data = api_handler._create_telemetry_record(
-                service, func.__name__, args, kwargs
-            )
-
-            endpoint = f"{api_handler.server_url}{api_handler.endpoints[service]}"
-
-            print(f"Sending telemetry data to {endpoint}")
-
-            send_in_loop(endpoint, telemetry_data)
+            # Record creation, endpoint resolution, batching and the actual
+            # send are all shared with the AST/IPython path.
+            api_handler.send_api_request(service, func.__name__, args, kwargs)
 
             # Call the original function
             return func(*args, **kwargs)
@@ -6,7 +6,7 @@ SPDX-License-Identifier: Apache-2.0
 from typing import Type, TypeVar, Iterator, Callable, Any
 import pydantic
 import copy
-from .utils import REGISTRIES
+from .utils import get_registries
 
 T = TypeVar("T", bound="TelemetryRegister")
 
@@ -42,7 +42,7 @@ class TelemetryRegister:
             return None
         self._initialized = True
         self.service = service
-        self.registry = copy.deepcopy(REGISTRIES.get(service, set()))
+        self.registry = copy.deepcopy(get_registries().get(service, set()))
 
     def __str__(self) -> str:
         return str(list(self.registry))
@@ -4,13 +4,16 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 from typing import Any
+import functools
 import yaml
 from pathlib import Path
 from dataclasses import dataclass, field
 
-
-with open(Path(__file__).parent / "config.yaml", "r") as f:
-    config = yaml.safe_load(f)
+try:
+    # The libyaml C extension parses much faster than the pure-Python loader.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
 
 @dataclass
@@ -42,13 +45,51 @@ def build_endpoints(
     return results
 
 
-ENDPOINTS = {
-    register.endpoint.replace("/", "_"): register.endpoint
-    for register in build_endpoints(config)
-}
+@functools.cache
+def _load_config() -> dict[str, Any]:
+    """
+    Parse config.yaml on first use. Deferring this keeps importing the package
+    cheap for consumers that never send a telemetry event.
+    """
+    with open(Path(__file__).parent / "config.yaml", "r") as f:
+        return yaml.load(f, Loader=_YamlLoader)  # type: ignore[no-any-return]
+
+
+@functools.cache
+def get_endpoints() -> dict[str, str]:
+    """
+    Return the {service name: endpoint} mapping from config.yaml, built once.
+    """
+    return {
+        register.endpoint.replace("/", "_"): register.endpoint
+        for register in build_endpoints(_load_config())
+    }
+
+
+@functools.cache
+def get_registries() -> dict[str, set[str]]:
+    """
+    Return the {service name: registered functions} mapping from config.yaml,
+    built once.
+    """
+    return {
+        register.endpoint.replace("/", "_"): register.items
+        for register in build_endpoints(_load_config())
+    }
+
 
-REGISTRIES = {
-    register.endpoint.replace("/", "_"): register.items
-    for register in build_endpoints(config)
-}
 SERVER_URL = "https://tracking-services-d6c2fd311c12.herokuapp.com"
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazy module-level aliases (PEP 562), kept for backwards compatibility -
+    resolving them here defers config.yaml parsing until first access.
+    """
+    if name == "config":
+        return _load_config()
+    if name == "ENDPOINTS":
+        return get_endpoints()
+    if name == "REGISTRIES":
+        return get_registries()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,10 +5,15 @@
 
 import access_py_telemetry.api
 from access_py_telemetry.api import SessionID, ApiHandler, send_in_loop
-from pydantic import ValidationError
 import pytest
 
+import json
+import subprocess
+import sys
+import textwrap
+import threading
 import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
 
 
 @pytest.fixture
@@ -99,9 +104,9 @@ def test_api_handler_extra_fields(local_host, api_handler):
 
 def test_api_handler_extra_fields_validation(api_handler):
     """
-    Pydantic should make sure that if we try to update the extra fields, we have
-    to pass the correct types, and only let us update fields through the
-    add_extra_field method.
+    Make sure that if we try to update the extra fields, we have to pass the
+    correct types, and only let us update fields through the add_extra_field
+    method.
     """
 
     # Mock a couple of extra services
@@ -120,12 +125,33 @@ def test_api_handler_extra_fields_validation(api_handler):
     with pytest.raises(KeyError):
         api_handler.add_extra_fields("catalogue", {"version": "2.0"})
 
-    with pytest.raises(ValidationError):
+    with pytest.raises(TypeError):
         api_handler.add_extra_fields("catalog", ["invalid", "type"])
 
     api_handler.add_extra_fields("payu", {"model": "ACCESS-OM2", "random_number": 2})
 
 
+def test_api_handler_extra_fields_in_place_mutation(api_handler):
+    """
+    Mutating the dict handed out by the extra_fields property in place should
+    show up in the next record, despite the cached per-service builders.
+    """
+    api_handler.endpoints = {"payu": "/payu/update"}
+    api_handler._extra_fields = {"payu": {}}
+
+    record = api_handler._create_telemetry_record(
+        service_name="payu", function_name="_test", args=[], kwargs={}
+    )
+    assert "model" not in record
+
+    api_handler.extra_fields["payu"]["model"] = "ACCESS-OM2"
+
+    record = api_handler._create_telemetry_record(
+        service_name="payu", function_name="_test", args=[], kwargs={}
+    )
+    assert record["model"] == "ACCESS-OM2"
+
+
 def test_api_handler_remove_fields(api_handler):
     """
     Check that we can remove fields from the telemetry record.
@@ -163,7 +189,7 @@ def test_api_handler_remove_fields(api_handler):
         "random_number": 2,
     }
 
-    assert api_handler._pop_fields == {"payu": ["session_id"]}
+    assert api_handler._pop_fields == {"payu": frozenset({"session_id"})}
 
     # Now remove the 'model' field from the payu record, as a string.
     api_handler.remove_fields("payu", "model")
@@ -212,6 +238,108 @@ def test_api_handler_send_api_request(api_handler, capsys):
     }
 
 
+def test_send_api_request_disabled(api_handler, monkeypatch):
+    """
+    The ACCESS_PY_TELEMETRY_DISABLE kill switch should make send_api_request a
+    no-op before any record is built.
+    """
+    monkeypatch.setattr(access_py_telemetry.api, "_TELEMETRY_ENABLED", False)
+
+    api_handler.endpoints = {"payu": "/payu/update"}
+    api_handler._extra_fields = {"payu": {}}
+
+    api_handler.send_api_request(
+        service_name="payu", function_name="_test", args=[1], kwargs={}
+    )
+
+    assert api_handler._buffers == {}
+    assert not hasattr(api_handler, "_last_record")
+
+    # Unknown services shouldn't raise either when telemetry is off
+    api_handler.send_api_request(
+        service_name="not_a_service", function_name="_test", args=[], kwargs={}
+    )
+
+
+def test_enqueue_batches_per_endpoint(api_handler, monkeypatch):
+    """
+    Records should accumulate per endpoint and go out as a single batch once
+    batch_size is reached.
+    """
+    sent = []
+    monkeypatch.setattr(
+        access_py_telemetry.api,
+        "send_in_loop",
+        lambda endpoint, data: sent.append((endpoint, data)),
+    )
+
+    api_handler.endpoints = {"payu": "/payu/update"}
+    api_handler._extra_fields = {"payu": {}}
+    api_handler.batch_size = 3
+
+    for i in range(3):
+        api_handler.send_api_request(
+            service_name="payu", function_name="_test", args=[i], kwargs={}
+        )
+
+    assert len(sent) == 1
+
+    endpoint, batch = sent[0]
+    assert endpoint.endswith("/payu/update")
+    assert [record["args"] for record in batch] == [[0], [1], [2]]
+
+    # The buffer should be empty again after the flush
+    assert api_handler._buffers == {}
+
+
+def test_buffered_records_delivered_at_exit():
+    """
+    Records buffered below batch_size in a short-lived script must still be
+    delivered: the atexit flush has to block until the background send has
+    actually gone out.
+    """
+    received = []
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            received.append(json.loads(self.rfile.read(length)))
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+
+    script = textwrap.dedent(
+        f"""
+        from access_py_telemetry.api import ApiHandler
+
+        handler = ApiHandler()
+        handler.server_url = "http://127.0.0.1:{server.server_port}"
+        handler.endpoints = {{"payu": "/payu/update"}}
+        handler._extra_fields = {{"payu": {{}}}}
+
+        for i in range(3):
+            handler.send_api_request(
+                service_name="payu", function_name="_test", args=[i], kwargs={{}}
+            )
+        """
+    )
+
+    try:
+        subprocess.run([sys.executable, "-c", script], check=True, timeout=60)
+    finally:
+        server.shutdown()
+        server_thread.join()
+        server.server_close()
+
+    assert sum(len(batch) for batch in received) == 3
+
+
 def test_send_in_loop_is_bg():
     """
     Send a request, but make sure that it runs in the background (ie. is non-blocking).
@@ -235,6 +363,52 @@ def test_send_in_loop_is_bg():
     assert dt < 4
 
 
+def test_summarize_values():
+    """
+    _summarize should pass small JSON-native values through unchanged and
+    collapse everything else to a bounded repr.
+    """
+    summarize = access_py_telemetry.api._summarize
+
+    # Small native values pass through untouched
+    assert summarize(None) is None
+    assert summarize(True) is True
+    assert summarize(42) == 42
+    assert summarize(1.5) == 1.5
+    assert summarize("short") == "short"
+    assert summarize([1, 2, 3]) == [1, 2, 3]
+    assert summarize({"a": 1}) == {"a": 1}
+
+    # Long strings are truncated to 256 chars
+    assert summarize("x" * 1000) == "x" * 256
+
+    # Large containers and arbitrary objects collapse to a truncated repr
+    big = list(range(1000))
+    assert summarize(big) == repr(big)[:256]
+    assert summarize(object()).startswith("<object object")
+
+    # Nesting is bounded: beyond the depth limit we fall back to repr
+    assert summarize([[["deep"]]]) == [[repr(["deep"])]]
+
+
+def test_create_telemetry_record_raw_args(api_handler):
+    """
+    Setting raw_args should put args/kwargs into the record verbatim instead
+    of the summarized form.
+    """
+    api_handler.endpoints = {"payu": "/payu/update"}
+    api_handler._extra_fields = {"payu": {}}
+    api_handler.raw_args = True
+
+    big = list(range(1000))
+    record = api_handler._create_telemetry_record(
+        service_name="payu", function_name="_test", args=[big], kwargs={"data": big}
+    )
+
+    assert record["args"][0] is big
+    assert record["kwargs"]["data"] is big
+
+
 def test_api_handler_invalid_endpoint(api_handler):
     """
     Create and send an API request with telemetry data.
@@ -1,5 +1,6 @@
 # type: ignore
 
+import access_py_telemetry.decorators
 from access_py_telemetry.decorators import ipy_register_func, register_func
 from access_py_telemetry.registry import TelemetryRegister
 from access_py_telemetry.api import ApiHandler
@@ -33,7 +34,7 @@ def test_ipy_register_func(api_handler, reset_telemetry_register):
         **blank_registries,
     }
 
-    assert api_handler.pop_fields == {"intake_catalog": ["session_id"]}
+    assert api_handler.pop_fields == {"intake_catalog": frozenset({"session_id"})}
 
     assert my_func.__name__ in register
 
@@ -68,7 +69,7 @@ async def test_register_func(api_handler, reset_telemetry_register):
         **blank_registries,
     }
 
-    assert api_handler.pop_fields == {"intake_catalog": ["session_id"]}
+    assert api_handler.pop_fields == {"intake_catalog": frozenset({"session_id"})}
 
     assert my_func.__name__ in register
 
@@ -87,3 +88,31 @@ async def test_register_func(api_handler, reset_telemetry_register):
     # Reset the register to avoid breaking other tests
 
     register.deregister(my_func.__name__)
+
+
+def test_register_func_disabled(api_handler, reset_telemetry_register, monkeypatch):
+    """
+    With telemetry disabled, both decorator factories should hand back the
+    function untouched and register nothing.
+    """
+    monkeypatch.setattr(access_py_telemetry.decorators, "_TELEMETRY_ENABLED", False)
+
+    @register_func(service="intake_catalog")
+    def my_func():
+        return 42
+
+    @ipy_register_func(service="intake_catalog")
+    def my_other_func():
+        return 99
+
+    assert my_func() == 42
+    assert my_other_func() == 99
+
+    # No wrapping took place...
+    assert not hasattr(my_func, "__wrapped__")
+    assert not hasattr(my_other_func, "__wrapped__")
+
+    # ... and nothing was registered
+    register = TelemetryRegister("intake_catalog")
+    assert my_func.__name__ not in register
+    assert my_other_func.__name__ not in register